@@ -72,6 +72,8 @@ class FakeClient:
     def __init__(self, torrents=None, torrent=None):
         self._torrents = torrents or []
         self._torrent = torrent or FakeTorrent()
+        self._recently_active: list = []
+        self._recently_removed: list[int] = []
         self.calls: dict[str, dict] = {}
 
     def get_session(self):
@@ -83,9 +85,16 @@ class FakeClient:
     def session_stats(self):
         return {"download_speed": 1024}
 
-    def get_torrents(self):
+    def get_torrents(self, ids=None, arguments=None):
+        self.calls["get_torrents"] = {"ids": ids, "arguments": arguments}
+        if ids is not None:
+            return [t for t in self._torrents if t.id in ids]
         return self._torrents
 
+    def get_recently_active_torrents(self, arguments=None):
+        self.calls["get_recently_active_torrents"] = {"arguments": arguments}
+        return self._recently_active, self._recently_removed
+
     def get_torrent(self, tid, **_):
         return self._torrent
 
@@ -106,6 +115,126 @@ def make_controller(client: FakeClient) -> TransmissionController:
     return ctrl
 
 
+# --------------------------------------------------------------------------
+# RPC executor
+# --------------------------------------------------------------------------
+
+def test_json_decode_path_works_with_or_without_orjson():
+    import transmission_rpc.client as rpc_client
+
+    # Whether or not the orjson codec was installed, decoding must behave
+    # like stdlib json and expose its error type for the library's handlers.
+    assert rpc_client.json.loads('{"result": "success"}') == {"result": "success"}
+    assert issubclass(rpc_client.json.JSONDecodeError, ValueError)
+
+
+def test_rpc_calls_run_on_dedicated_worker():
+    import threading
+
+    ctrl = make_controller(FakeClient())
+    name = run(ctrl._to_thread(lambda: threading.current_thread().name))
+    assert name.startswith("torsh-rpc")
+
+
+def test_tune_http_session_mounts_pooled_adapter():
+    import requests
+
+    class StubClient:
+        _http_session = requests.Session()
+
+    stub = StubClient()
+    TransmissionController._tune_http_session(stub)
+    adapter = stub._http_session.get_adapter("http://localhost:9091")
+    assert adapter.max_retries.total == 0  # retries belong to _rpc, not urllib3
+    assert stub._http_session.headers["Connection"] == "keep-alive"
+
+
+def test_transient_errors_keep_the_session_alive():
+    from transmission_rpc import TransmissionError
+
+    class FlakyClient(FakeClient):
+        attempts = 0
+
+        def get_session(self):
+            self.attempts += 1
+            if self.attempts == 1:
+                raise TransmissionError("temporary glitch")
+            return super().get_session()
+
+    client = FlakyClient()
+    ctrl = TransmissionController(AppConfig(), retries=1, backoff=0.1)
+    ctrl._client = client
+    generation = ctrl._client_gen
+    run(ctrl.get_speed_limits())
+    assert client.attempts == 2
+    assert ctrl._client_gen == generation  # no reset: same HTTP session reused
+
+
+def test_auth_errors_are_not_retried():
+    from transmission_rpc.error import TransmissionAuthError
+
+    class AuthFailingClient(FakeClient):
+        attempts = 0
+
+        def get_session(self):
+            self.attempts += 1
+            raise TransmissionAuthError("401")
+
+    client = AuthFailingClient()
+    ctrl = TransmissionController(AppConfig(), retries=3)
+    ctrl._client = client
+    with pytest.raises(TransmissionAuthError):
+        run(ctrl.get_speed_limits())
+    assert client.attempts == 1  # no pointless retries against bad credentials
+
+
+def test_concurrent_identical_reads_are_coalesced():
+    class CountingClient(FakeClient):
+        session_calls = 0
+
+        def get_session(self):
+            self.session_calls += 1
+            return super().get_session()
+
+    client = CountingClient()
+    ctrl = make_controller(client)
+
+    async def burst():
+        await asyncio.gather(ctrl._call("get_session"), ctrl._call("get_session"))
+
+    run(burst())
+    assert client.session_calls == 1
+    assert ctrl._inflight == {}  # bookkeeping cleaned up after completion
+
+
+def test_recent_reads_are_cached_until_a_mutation():
+    class CountingClient(FakeClient):
+        session_calls = 0
+
+        def get_session(self):
+            self.session_calls += 1
+            return super().get_session()
+
+    client = CountingClient()
+    ctrl = make_controller(client)
+
+    async def sequence():
+        await ctrl._call("get_session")
+        await ctrl._call("get_session")  # within the TTL: served from cache
+        await ctrl._call("start_torrent", 1)  # any write drops cached reads
+        await ctrl._call("get_session")
+
+    run(sequence())
+    assert client.session_calls == 2
+
+
+def test_aclose_shuts_down_executor():
+    ctrl = make_controller(FakeClient())
+    run(ctrl.aclose())
+    with pytest.raises(RuntimeError):
+        run(ctrl._to_thread(lambda: None))
+
+
 # --------------------------------------------------------------------------
 # Pure mapping helpers
 # --------------------------------------------------------------------------
@@ -145,6 +274,31 @@ def test_natural_rate_and_coercion():
     assert TransmissionController._as_float(None) is None
 
 
+def test_formatters_are_cached():
+    from torsh.client import _fmt_rate
+
+    # Repeated rates must hit the lru_cache and return the identical string.
+    assert _fmt_rate(1048576) is _fmt_rate(1048576)
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        (0, "0 Bytes"),
+        (1, "1 Byte"),
+        (512, "512 Bytes"),
+        (1024, "1.0 KiB"),
+        (1048576, "1.0 MiB"),
+        (2 * 1024**3, "2.0 GiB"),
+        (3 * 1024**4, "3.0 TiB"),
+    ],
+)
+def test_fmt_size_matches_humanize_format(value, expected):
+    from torsh.client import _fmt_size
+
+    assert _fmt_size(value) == expected
+
+
 # --------------------------------------------------------------------------
 # Mapping a full torrent
 # --------------------------------------------------------------------------
@@ -160,12 +314,98 @@ def test_map_torrent_produces_view():
     assert view.error_string == "tracker gone"
 
 
+def test_map_torrent_uses_raw_fields_when_available():
+    class RawFieldsTorrent:
+        fields = {
+            "id": 7,
+            "name": "Raw ISO",
+            "percentDone": 0.25,
+            "status": 4,
+            "eta": 180,
+            "rateDownload": 1048576,
+            "rateUpload": 0,
+            "uploadRatio": 0.5,
+            "totalSize": 2 * 1024**3,
+            "addedDate": 1704067200,
+            "downloadDir": "/downloads",
+            "peersConnected": 8,
+            "peersSendingToUs": 5,
+            "peersGettingFromUs": 2,
+            "error": 0,
+            "errorString": "",
+        }
+
+    view = make_controller(FakeClient())._map_torrent(RawFieldsTorrent())
+    assert view.id == 7
+    assert view.status == "downloading"
+    assert view.percent_done == pytest.approx(25.0)
+    assert view.eta == "3 minutes"
+    assert view.rate_down == "1.0 MiB/s"
+    assert view.added == datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
 def test_list_torrents_roundtrip():
     client = FakeClient(torrents=[FakeTorrent(id=1), FakeTorrent(id=2)])
     views = run(make_controller(client).list_torrents())
     assert [v.id for v in views] == [1, 2]
 
 
+def test_list_torrents_requests_only_view_fields():
+    client = FakeClient(torrents=[FakeTorrent()])
+    run(make_controller(client).list_torrents())
+    arguments = client.calls["get_torrents"]["arguments"]
+    # Field filter must stay in sync with what _map_torrent reads.
+    assert "id" in arguments and "percentDone" in arguments and "errorString" in arguments
+    assert "files" not in arguments and "pieces" not in arguments
+
+
+def test_get_torrents_bulk_fetches_many_ids_in_one_call():
+    client = FakeClient(torrents=[FakeTorrent(id=1), FakeTorrent(id=2), FakeTorrent(id=3)])
+    bulk = run(make_controller(client).get_torrents_bulk([1, 3]))
+    assert sorted(bulk) == [1, 3]
+    assert client.calls["get_torrents"]["ids"] == [1, 3]  # single round trip
+
+
+def test_list_torrents_reuses_views_for_idle_torrents():
+    ctrl = make_controller(FakeClient(torrents=[FakeTorrent(id=1)]))
+    first = run(ctrl.list_torrents())
+    second = run(ctrl.list_torrents())
+    assert first[0] is second[0]  # unchanged signature -> cached view
+
+
+def test_view_cache_drops_removed_and_changed_torrents():
+    client = FakeClient(torrents=[FakeTorrent(id=1), FakeTorrent(id=2)])
+    ctrl = make_controller(client)
+    first = run(ctrl.list_torrents())
+    client._recently_active = [FakeTorrent(id=1, rate_download=0)]
+    client._recently_removed = [2]
+    second = run(ctrl.list_torrents())
+    assert second[0] is not first[0]  # rate changed -> remapped
+    assert set(ctrl._view_cache) == {1}  # id 2 dropped via the removed list
+
+
+def test_second_listing_is_incremental():
+    client = FakeClient(torrents=[FakeTorrent(id=1), FakeTorrent(id=2)])
+    ctrl = make_controller(client)
+    run(ctrl.list_torrents())  # full fetch primes the cache
+    client._recently_active = [FakeTorrent(id=3)]
+    views = run(ctrl.list_torrents())
+    assert "get_recently_active_torrents" in client.calls
+    assert [v.id for v in views] == [1, 2, 3]
+
+
+def test_snapshot_fuses_stats_and_limits():
+    client = FakeClient(
+        torrents=[FakeTorrent(id=1), FakeTorrent(id=2, status="stopped", rate_download=0)]
+    )
+    views, stats, limits = run(make_controller(client).snapshot())
+    assert [v.id for v in views] == [1, 2]
+    assert stats.download_speed == 1048576
+    assert stats.active_torrent_count == 1
+    assert stats.paused_torrent_count == 1
+    assert limits == {"down": 500, "up": 0}  # derived from the session, no extra RPC
+
+
 # --------------------------------------------------------------------------
 # Speed limits — guards the attribute/kwarg names
 # --------------------------------------------------------------------------
@@ -224,6 +464,20 @@ def test_set_priority_uses_change_torrent():
     assert call["priority_low"] == [3]
 
 
+def test_apply_torrent_settings_fuses_speed_and_priority():
+    client = FakeClient()
+    run(
+        make_controller(client).apply_torrent_settings(
+            9, high=[0], normal=[1], low=[], down_kib=512, up_kib=0
+        )
+    )
+    call = client.calls["change_torrent"]
+    assert call["ids"] == 9
+    assert call["download_limit"] == 512 and call["download_limited"] is True
+    assert call["upload_limited"] is False
+    assert call["priority_high"] == [0] and call["priority_low"] is None
+
+
 # --------------------------------------------------------------------------
 # Trackers
 # --------------------------------------------------------------------------
@@ -252,3 +506,14 @@ def test_start_passes_bypass_queue():
     client = FakeClient()
     run(make_controller(client).start([1, 2]))
     assert client.calls["start_torrent"] == {"ids": [1, 2], "bypass_queue": True}
+
+
+def test_rapid_mutations_are_debounced_into_one_rpc():
+    client = FakeClient()
+    ctrl = make_controller(client)
+
+    async def burst():
+        await asyncio.gather(ctrl.start([1]), ctrl.start([2]), ctrl.start([3]))
+
+    run(burst())
+    assert client.calls["start_torrent"] == {"ids": [1, 2, 3], "bypass_queue": True}
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import importlib
+import json
 
 import pytest
 import yaml
@@ -54,20 +55,28 @@ def test_normalize_clamps_invalid_values(config_mod):
     assert normalized.rpc.timeout >= 1.0
 
 
-def test_corrupted_yaml_falls_back_to_defaults(config_mod):
+def test_corrupted_config_falls_back_to_defaults(config_mod):
     config_mod.ensure_config_dir(config_mod.CONFIG_DIR)
-    config_mod.CONFIG_FILE.write_text("this: : not: valid: yaml: [")
+    config_mod.CONFIG_FILE.write_text('{"rpc": not valid json [')
     cfg = config_mod.load_config()  # must not raise
     assert cfg.rpc.host == "localhost"
 
 
 def test_invalid_sort_column_is_dropped(config_mod):
     config_mod.ensure_config_dir(config_mod.CONFIG_DIR)
-    config_mod.CONFIG_FILE.write_text(yaml.safe_dump({"ui": {"sort_column": 42}}))
+    config_mod.CONFIG_FILE.write_text(json.dumps({"ui": {"sort_column": 42}}))
     cfg = config_mod.load_config()
     assert cfg.ui.sort_column is None
 
 
+def test_legacy_yaml_config_is_migrated(config_mod):
+    config_mod.ensure_config_dir(config_mod.CONFIG_DIR)
+    config_mod._LEGACY_CONFIG_FILE.write_text(yaml.safe_dump({"rpc": {"port": 14141}}))
+    cfg = config_mod.load_config()
+    assert cfg.rpc.port == 14141
+    assert config_mod.CONFIG_FILE.exists()  # rewritten as JSON
+
+
 def test_save_is_idempotent(config_mod):
     cfg = config_mod.load_config()
     config_mod.save_config(cfg)
@@ -6,21 +6,40 @@ Transmission daemon is reachable, then hands control to the Textual TUI.
 from __future__ import annotations
 
 import asyncio
+import threading
 from pathlib import Path
 
 import click
 from rich.console import Console
 
+# Optional: a faster event loop helps most during heavy refresh ticks.
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - depends on the environment
+    uvloop = None
+
 from . import __version__
 from .config import AppConfig, load_config, save_config
 from .daemon import maybe_start_daemon, rpc_reachable
 from .logging import get_logger
 from .ui import console as boot
-from .ui.app import TorshApp
 
 LOG = get_logger(__name__)
 
 
+def _preload_ui() -> None:
+    """Import the heavy TUI stack (textual and friends) ahead of time.
+
+    ``torsh.ui.app`` drags in a couple hundred transitive modules; doing it
+    on a background thread overlaps that work with the boot sequence so the
+    import in ``main`` is a ``sys.modules`` hit instead of a visible pause.
+    """
+    try:
+        from .ui import app  # noqa: F401
+    except Exception:  # pragma: no cover - surfaces again on the real import
+        pass
+
+
 def _apply_overrides(
     config: AppConfig,
     *,
@@ -66,6 +85,7 @@ def main(
     no_banner: bool,
 ) -> None:
     """Launch the torsh TUI."""
+    threading.Thread(target=_preload_ui, name="torsh-ui-preload", daemon=True).start()
     console = Console()
 
     config = load_config()
@@ -87,6 +107,11 @@ def main(
 
     _boot_daemon(console, config)
 
+    from .ui.app import TorshApp  # usually already loaded by _preload_ui
+
+    if uvloop is not None:
+        uvloop.install()
+
     app = TorshApp(config=config)
     try:
         asyncio.run(app.run_async())
@@ -5,11 +5,29 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict
 
-import yaml
+import json
+
+# The config has a fixed, torsh-written schema, so it is stored as JSON;
+# orjson parses/serializes it an order of magnitude faster when installed.
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(payload: Any) -> bytes:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+
+except ImportError:  # pragma: no cover - depends on the environment
+    _loads = json.loads
+
+    def _dumps(payload: Any) -> bytes:
+        return json.dumps(payload, indent=2).encode()
 
 
 CONFIG_DIR = Path(os.environ.get("TORSH_CONFIG_DIR", "~/.config/torsh")).expanduser()
-CONFIG_FILE = CONFIG_DIR / "config.yaml"
+CONFIG_FILE = CONFIG_DIR / "config.json"
+# Pre-JSON installs kept the config in YAML; read once for migration.
+_LEGACY_CONFIG_FILE = CONFIG_DIR / "config.yaml"
 
 
 def _safe_bool(value: Any, default: bool) -> bool:
@@ -48,7 +66,7 @@ def _safe_path(value: Any, default: Path) -> Path:
         return default.expanduser()
 
 
-@dataclass
+@dataclass(slots=True)
 class RpcConfig:
     host: str = os.environ.get("TORSH_HOST", "localhost")
     port: int = field(default_factory=lambda: _safe_int(os.environ.get("TORSH_PORT", "9091"), 9091, minimum=1, maximum=65535))
@@ -66,7 +84,7 @@ class RpcConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DaemonConfig:
     autostart: bool = os.environ.get("TORSH_AUTOSTART", "true").lower() != "false"
     binary: str = os.environ.get("TORSH_DAEMON", "transmission-daemon")
@@ -87,7 +105,7 @@ class DaemonConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PathConfig:
     download_dir: Path = Path(os.environ.get("TORSH_DOWNLOAD_DIR", "~/Downloads/torrents")).expanduser()
     config_dir: Path = CONFIG_DIR
@@ -99,7 +117,7 @@ class PathConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class UIConfig:
     refresh_interval: float = 2.5
     sort_column: int | None = None
@@ -119,7 +137,7 @@ class UIConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     rpc: RpcConfig = field(default_factory=RpcConfig)
     daemon: DaemonConfig = field(default_factory=DaemonConfig)
@@ -140,13 +158,25 @@ def ensure_config_dir(path: Path = CONFIG_DIR) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
-def _load_yaml(path: Path) -> Dict[str, Any]:
+def _load_data(path: Path) -> Dict[str, Any]:
     if not path.exists():
         return {}
     try:
-        return yaml.safe_load(path.read_text()) or {}
+        return _loads(path.read_bytes()) or {}
+    except Exception:
+        # A corrupted file should not crash the app; fall back to defaults.
+        return {}
+
+
+def _migrate_legacy_yaml() -> Dict[str, Any]:
+    """Read the pre-JSON ``config.yaml`` once so old installs keep their settings."""
+    if not _LEGACY_CONFIG_FILE.exists():
+        return {}
+    try:
+        import yaml
+
+        return yaml.safe_load(_LEGACY_CONFIG_FILE.read_text()) or {}
     except Exception:
-        # Corrupted YAML should not crash the app; fall back to defaults.
         return {}
 
 
@@ -229,9 +259,11 @@ def _merge_config(data: Dict[str, Any]) -> AppConfig:
 
 def load_config() -> AppConfig:
     ensure_config_dir(CONFIG_DIR)
-    data = _load_yaml(CONFIG_FILE)
+    data = _load_data(CONFIG_FILE)
+    if not data and not CONFIG_FILE.exists():
+        data = _migrate_legacy_yaml()
     config = _merge_config(data)
-    save_config(config)
+    save_config(config)  # rewrites migrated/normalised data as JSON
     return config
 
 
@@ -240,12 +272,18 @@ def save_config(config: AppConfig) -> None:
     target = CONFIG_FILE
     ensure_config_dir(target.parent)
 
-    current = _load_yaml(target)
-    if current == payload:
-        return
+    serialized = _dumps(payload)
+
+    # Compare the serialized bytes, not re-parsed dicts: it skips a parse
+    # round-trip and still avoids needless rewrites on every startup.
+    try:
+        if target.read_bytes() == serialized:
+            return
+    except OSError:
+        pass
 
     tmp = target.with_suffix(".tmp")
-    tmp.write_text(yaml.safe_dump(payload, sort_keys=False, allow_unicode=False))
+    tmp.write_bytes(serialized)
     tmp.replace(target)
 
 
@@ -1,4 +1,8 @@
+import asyncio
+import functools
+import os
 import shutil
+import signal
 import subprocess
 import time
 import socket
@@ -9,11 +13,52 @@ from typing import Iterable
 from .config import AppConfig, save_config
 from .logging import get_logger
 
+# settings.json is only reparsed by the daemon, never read by a human, so it
+# is written compact; orjson takes the same shortcut faster when installed.
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+except ImportError:  # pragma: no cover - depends on the environment
+
+    def _dumps(payload: dict) -> bytes:
+        return json.dumps(payload, separators=(",", ":")).encode()
+
 
 LOG = get_logger(__name__)
 
 
+# /proc/<pid>/comm holds the name truncated to TASK_COMM_LEN-1 (15) chars.
+_DAEMON_COMM = "transmission-daemon"[:15] + "\n"
+
+
+def _daemon_pids(comm: str = _DAEMON_COMM) -> list[int] | None:
+    """PIDs whose ``/proc/<pid>/comm`` matches, or ``None`` without /proc."""
+    try:
+        entries = os.scandir("/proc")
+    except OSError:
+        return None  # non-Linux: caller falls back to pgrep/pkill
+
+    pids: list[int] = []
+    with entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry.name}/comm") as handle:
+                    if handle.read() == comm:
+                        pids.append(int(entry.name))
+            except OSError:
+                continue  # process exited mid-scan
+    return pids
+
+
 def _is_daemon_running() -> bool:
+    """Check for a running daemon without forking ``pgrep`` when possible."""
+    pids = _daemon_pids()
+    if pids is not None:
+        return bool(pids)
+
     try:
         result = subprocess.run(
             ["pgrep", "-x", "transmission-daemon"],
@@ -26,38 +71,82 @@ def _is_daemon_running() -> bool:
         return False
 
 
+# Detection rarely changes across runs, so the winner is persisted here and
+# only re-scanned when the cached binary has vanished from PATH.
+_PKGMGR_CACHE = Path.home() / ".cache" / "torsh" / "pkgmgr"
+
+
+@functools.cache
 def _detect_package_manager() -> str | None:
+    # PATH does not change during a run, so one scan serves the process.
     managers = ["apt-get", "apt", "brew", "dnf", "yum", "pacman", "zypper"]
+    try:
+        cached = _PKGMGR_CACHE.read_text().strip()
+    except OSError:
+        cached = ""
+    if cached in managers and shutil.which(cached):
+        return cached
+
     for mgr in managers:
         if shutil.which(mgr):
+            try:
+                _PKGMGR_CACHE.parent.mkdir(parents=True, exist_ok=True)
+                tmp = _PKGMGR_CACHE.with_suffix(".tmp")
+                tmp.write_text(mgr + "\n")
+                tmp.replace(_PKGMGR_CACHE)
+            except OSError:  # pragma: no cover - cache is best-effort
+                pass
             return mgr
     return None
 
 
-def _install_transmission(manager: str) -> bool:
-    steps = {
-        "apt-get": [
-            ["sudo", "apt-get", "update"],
-            ["sudo", "apt-get", "-y", "install", "transmission-daemon"],
-        ],
-        "apt": [
-            ["sudo", "apt", "update"],
-            ["sudo", "apt", "-y", "install", "transmission-daemon"],
-        ],
-        "brew": [["brew", "install", "transmission"]],
-        "dnf": [["sudo", "dnf", "-y", "install", "transmission-daemon"]],
-        "yum": [["sudo", "yum", "-y", "install", "transmission-daemon"]],
-        "pacman": [["sudo", "pacman", "-Sy", "--noconfirm", "transmission-cli"]],
-        "zypper": [["sudo", "zypper", "--non-interactive", "install", "transmission-daemon"]],
-    }.get(manager)
+_which_cache: dict[str, str] = {}
+
+
+def _which(binary: str) -> str | None:
+    """:func:`shutil.which` caching hits only, so a fresh install is noticed."""
+    path = _which_cache.get(binary)
+    if path is None:
+        path = shutil.which(binary)
+        if path:
+            _which_cache[binary] = path
+    return path
+
+
+_INSTALL_STEPS: dict[str, list[list[str]]] = {
+    "apt-get": [
+        ["sudo", "apt-get", "update"],
+        ["sudo", "apt-get", "-y", "install", "transmission-daemon"],
+    ],
+    "apt": [
+        ["sudo", "apt", "update"],
+        ["sudo", "apt", "-y", "install", "transmission-daemon"],
+    ],
+    "brew": [["brew", "install", "transmission"]],
+    "dnf": [["sudo", "dnf", "-y", "install", "transmission-daemon"]],
+    "yum": [["sudo", "yum", "-y", "install", "transmission-daemon"]],
+    "pacman": [["sudo", "pacman", "-Sy", "--noconfirm", "transmission-cli"]],
+    "zypper": [["sudo", "zypper", "--non-interactive", "install", "transmission-daemon"]],
+}
+
+
+def _install_env(manager: str) -> dict[str, str] | None:
+    if manager in ("apt", "apt-get"):
+        # Skip debconf's interactive tty probes during the install step.
+        return {**os.environ, "DEBIAN_FRONTEND": "noninteractive"}
+    return None
 
+
+def _install_transmission(manager: str) -> bool:
+    steps = _INSTALL_STEPS.get(manager)
     if not steps:
         return False
 
+    env = _install_env(manager)
     LOG.info("Trying to install transmission via %s", manager)
     try:
         for cmd in steps:
-            result = subprocess.run(cmd, check=False)
+            result = subprocess.run(cmd, check=False, env=env)
             if result.returncode != 0:
                 LOG.warning("Step failed for %s: %s", manager, " ".join(cmd))
                 return False
@@ -67,9 +156,33 @@ def _install_transmission(manager: str) -> bool:
         return False
 
 
+async def _install_transmission_async(manager: str) -> bool:
+    """Async twin of :func:`_install_transmission` using subprocess_exec.
+
+    A package install can take minutes; awaiting each step keeps the TUI
+    repainting instead of freezing the event loop for the duration.
+    """
+    steps = _INSTALL_STEPS.get(manager)
+    if not steps:
+        return False
+
+    env = _install_env(manager)
+    LOG.info("Trying to install transmission via %s", manager)
+    try:
+        for cmd in steps:
+            proc = await asyncio.create_subprocess_exec(*cmd, env=env)
+            if await proc.wait() != 0:
+                LOG.warning("Step failed for %s: %s", manager, " ".join(cmd))
+                return False
+        return True
+    except Exception as exc:  # pragma: no cover - safeguard
+        LOG.error("Auto-install failed: %s", exc)
+        return False
+
+
 def ensure_transmission_available(config: AppConfig) -> bool:
     """Ensure transmission binary exists; optionally try to install it."""
-    if shutil.which(config.daemon.binary):
+    if _which(config.daemon.binary):
         return True
     if not config.daemon.install_missing:
         LOG.warning("Binary %s not found, auto-install is disabled", config.daemon.binary)
@@ -85,18 +198,51 @@ def ensure_transmission_available(config: AppConfig) -> bool:
         LOG.warning("Auto-install via %s failed", mgr)
         return False
 
-    return shutil.which(config.daemon.binary) is not None
+    return _which(config.daemon.binary) is not None
+
+
+async def ensure_transmission_available_async(config: AppConfig) -> bool:
+    """:func:`ensure_transmission_available` with a non-blocking install step."""
+    if _which(config.daemon.binary):
+        return True
+    if not config.daemon.install_missing:
+        LOG.warning("Binary %s not found, auto-install is disabled", config.daemon.binary)
+        return False
+
+    mgr = _detect_package_manager()
+    if not mgr:
+        LOG.warning("No supported package manager found for auto-install")
+        return False
+
+    if not await _install_transmission_async(mgr):
+        LOG.warning("Auto-install via %s failed", mgr)
+        return False
+
+    return _which(config.daemon.binary) is not None
+
+
+# Directories already ensured this run; repeat launches skip the stat+mkdir.
+_ensured_dirs: set[Path] = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    if path in _ensured_dirs:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    _ensured_dirs.add(path)
 
 
 def _has_flag(args: list[str], flag: str) -> bool:
-    return any(a == flag or a.startswith(f"{flag}=") for a in args)
+    prefix = flag + "="  # built once, not per scanned argument
+    return any(a == flag or a.startswith(prefix) for a in args)
 
 
 def _pick_free_port(start: int, attempts: int = 10) -> int:
     port = max(1, start)
     for _ in range(attempts):
+        # No SO_REUSEADDR on purpose: it lets bind() succeed on ports still
+        # in TIME_WAIT, which the daemon would then fail to claim for real.
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             try:
                 s.bind(("0.0.0.0", port))
                 return port
@@ -105,29 +251,51 @@ def _pick_free_port(start: int, attempts: int = 10) -> int:
     return start
 
 
+# Ports last written to settings.json; repeat launches with the same ports
+# skip the read/modify/write entirely.
+_last_written_ports: tuple[int, int | None] | None = None
+
+
 def _write_settings_ports(cfg_dir: Path, rpc_port: int, peer_port: int | None) -> None:
+    global _last_written_ports
+    if _last_written_ports == (rpc_port, peer_port):
+        return
+
     settings_path = cfg_dir / "settings.json"
-    data: dict = {}
-    if settings_path.exists():
-        try:
-            data = json.loads(settings_path.read_text() or "{}")
-        except Exception:
-            data = {}
-    # Apply ports
-    data["rpc-port"] = rpc_port
+    if not settings_path.exists():
+        # Fresh start: the CLI flags already carry the ports to the daemon.
+        _last_written_ports = (rpc_port, peer_port)
+        return
+
+    try:
+        data = json.loads(settings_path.read_text() or "{}")
+    except Exception:
+        data = {}
+    desired: dict = {"rpc-port": rpc_port}
     if peer_port:
-        data["peer-port"] = peer_port
-        data["peer-port-random-on-start"] = False
+        desired["peer-port"] = peer_port
+        desired["peer-port-random-on-start"] = False
+    if all(data.get(key) == value for key, value in desired.items()):
+        _last_written_ports = (rpc_port, peer_port)
+        return
+
+    data.update(desired)
     tmp = settings_path.with_suffix(".tmp")
-    tmp.write_text(json.dumps(data, indent=2))
-    tmp.replace(settings_path)
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        os.write(fd, _dumps(data))
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp, settings_path)
+    _last_written_ports = (rpc_port, peer_port)
 
 
-def _build_daemon_args(config: AppConfig, peer_port: int | None) -> list[str]:
+def _build_daemon_args(config: AppConfig, rpc_port: int, peer_port: int | None) -> list[str]:
     cfg_dir = config.paths.config_dir
     download_dir = config.paths.download_dir
-    cfg_dir.mkdir(parents=True, exist_ok=True)
-    download_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(cfg_dir)
+    _ensure_dir(download_dir)
 
     args = [
         config.daemon.binary,
@@ -139,36 +307,45 @@ def _build_daemon_args(config: AppConfig, peer_port: int | None) -> list[str]:
         "--log-info",
     ]
     extra = config.daemon.extra_args or []
+    # CLI flags beat settings.json, so a fresh install needs no settings write.
+    if not _has_flag(extra, "--port"):
+        args.extend(["--port", str(rpc_port)])
     if peer_port and not _has_flag(extra, "--peerport"):
         args.extend(["--peerport", str(peer_port)])
     args.extend(extra)
     return args
 
 
-def maybe_start_daemon(config: AppConfig, wait_seconds: float = 2.5) -> None:
+def _launch_daemon(config: AppConfig) -> int | None:
+    """Spawn transmission-daemon if needed; return its RPC port, else ``None``.
+
+    Everything here is non-blocking (``Popen`` returns immediately) — the
+    callers decide how to wait for the daemon to come up.
+    """
     if not config.daemon.autostart:
         LOG.info("Daemon autostart disabled")
-        return
+        return None
 
     if not ensure_transmission_available(config):
         LOG.error("Transmission unavailable. Install manually or enable auto-install.")
-        return
+        return None
 
     if _is_daemon_running():
         LOG.debug("transmission-daemon is already running")
-        return
+        return None
 
-    binary = shutil.which(config.daemon.binary)
+    binary = _which(config.daemon.binary)
     if not binary:
         LOG.warning("Binary transmission-daemon not found: %s", config.daemon.binary)
-        return
+        return None
 
     # Pick ports if defaults are occupied
     chosen_rpc_port = _pick_free_port(config.rpc.port)
     if chosen_rpc_port != config.rpc.port:
         LOG.warning("RPC port %s busy, switching to %s", config.rpc.port, chosen_rpc_port)
+        # In-memory only: the callers persist the new port once the daemon
+        # is actually answering on it, so a failed start costs no disk write.
         config.rpc.port = chosen_rpc_port
-        save_config(config)
 
     chosen_peer_port = _pick_free_port(51413)
     if chosen_peer_port != 51413:
@@ -177,45 +354,141 @@ def maybe_start_daemon(config: AppConfig, wait_seconds: float = 2.5) -> None:
     # Write ports into settings.json so daemon picks them up (rpc-port/peer-port)
     _write_settings_ports(config.paths.config_dir, chosen_rpc_port, chosen_peer_port)
 
-    args = _build_daemon_args(config, chosen_peer_port)
+    args = _build_daemon_args(config, chosen_rpc_port, chosen_peer_port)
     log_file = config.daemon.log_path
-    log_file.parent.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(log_file.parent)
 
     LOG.info("Starting transmission-daemon: %s", " ".join(args))
     log_handle = None
     try:
-        log_handle = log_file.open("a", encoding="utf-8")
-        subprocess.Popen(
-            args,
-            stdout=log_handle,
-            stderr=log_handle,
-            close_fds=True,
-            start_new_session=True,
-        )
-        # Daemon now owns the file handle; don't close it
-        log_handle = None
+        # Binary append: the parent only needs the fd to hand to the child,
+        # so the text codec layer would be pure setup cost.
+        log_handle = log_file.open("ab")
+        try:
+            # posix_spawn skips fork's copy-on-write duplication of the
+            # Python heap; the child gets dup2'd copies of the log fd and
+            # its own session, so the parent handle can close immediately.
+            fd = log_handle.fileno()
+            os.posix_spawn(
+                binary,
+                args,
+                dict(os.environ),
+                file_actions=[(os.POSIX_SPAWN_DUP2, fd, 1), (os.POSIX_SPAWN_DUP2, fd, 2)],
+                setsid=True,
+            )
+            log_handle.close()
+            log_handle = None
+        except (AttributeError, NotImplementedError):
+            # Platforms without posix_spawn/setsid support.
+            subprocess.Popen(
+                args,
+                stdout=log_handle,
+                stderr=log_handle,
+                close_fds=True,
+                start_new_session=True,
+            )
+            # Daemon now owns the file handle; don't close it
+            log_handle = None
     except Exception as exc:  # pragma: no cover - safeguard
         LOG.error("Failed to start transmission-daemon: %s", exc)
-        # Close handle only if Popen failed
+        # Close handle only if the spawn failed
         if log_handle:
             log_handle.close()
+        return None
+
+    return chosen_rpc_port
+
+
+def maybe_start_daemon(config: AppConfig, wait_seconds: float = 2.5) -> None:
+    previous_port = config.rpc.port
+    port = _launch_daemon(config)
+    if port is None:
         return
+    # No blind settle sleep: poll immediately with backoff — on a warm
+    # machine the daemon accepts connections within tens of milliseconds.
+    up = _wait_for_rpc(config.rpc.host, port, timeout=wait_seconds + 5.0)
+    if up and config.rpc.port != previous_port:
+        save_config(config)
 
-    # give daemon time to start
-    time.sleep(wait_seconds)
-    _wait_for_rpc(config.rpc.host, chosen_rpc_port, timeout=5.0)
 
+async def maybe_start_daemon_async(config: AppConfig, wait_seconds: float = 2.5) -> None:
+    """:func:`maybe_start_daemon` for async callers — waits without blocking the loop."""
+    if config.daemon.autostart:
+        # Run the potentially multi-minute install step asynchronously first;
+        # _launch_daemon's own availability check then hits the _which cache.
+        await ensure_transmission_available_async(config)
+    previous_port = config.rpc.port
+    port = _launch_daemon(config)
+    if port is None:
+        return
+    up = await _wait_for_rpc_async(config.rpc.host, port, timeout=wait_seconds + 5.0)
+    if up and config.rpc.port != previous_port:
+        save_config(config)
 
-def stop_daemon(process_names: Iterable[str] = ("transmission-daemon",)) -> None:
+
+def _signal_daemons(process_names: Iterable[str]) -> list[int] | None:
+    """SIGTERM matching processes; return pollable PIDs, or ``None`` via pkill."""
+    signalled: list[int] = []
+    used_pkill = False
     for name in process_names:
-        try:
-            subprocess.run(["pkill", "-x", name], check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        except FileNotFoundError:
-            LOG.debug("pkill is not available on this system")
-            break
+        pids = _daemon_pids(name[:15] + "\n")
+        if pids is None:
+            used_pkill = True
+            try:
+                subprocess.run(["pkill", "-x", name], check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            except FileNotFoundError:
+                LOG.debug("pkill is not available on this system")
+                break
+            continue
+        for pid in pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+                signalled.append(pid)
+            except (ProcessLookupError, PermissionError):
+                continue  # already gone, or not ours to stop
+    return None if used_pkill else signalled
 
-    # small delay to let daemon exit
-    time.sleep(0.5)
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass  # exists, just not ours
+    return True
+
+
+# Exit polling: the daemon usually dies within milliseconds of SIGTERM, so
+# poll at 10 ms granularity instead of sleeping the worst case up front.
+_EXIT_TIMEOUT = 0.5
+_EXIT_INTERVAL = 0.01
+
+
+def stop_daemon(process_names: Iterable[str] = ("transmission-daemon",)) -> None:
+    remaining = _signal_daemons(process_names)
+    if remaining is None:
+        # pkill fallback path: no PIDs to poll, keep the old settle delay.
+        time.sleep(_EXIT_TIMEOUT)
+        return
+    deadline = time.time() + _EXIT_TIMEOUT
+    while remaining and time.time() < deadline:
+        remaining = [pid for pid in remaining if _alive(pid)]
+        if remaining:
+            time.sleep(_EXIT_INTERVAL)
+
+
+async def stop_daemon_async(process_names: Iterable[str] = ("transmission-daemon",)) -> None:
+    """:func:`stop_daemon` for async callers — waits without blocking the loop."""
+    remaining = _signal_daemons(process_names)
+    if remaining is None:
+        await asyncio.sleep(_EXIT_TIMEOUT)
+        return
+    deadline = time.time() + _EXIT_TIMEOUT
+    while remaining and time.time() < deadline:
+        remaining = [pid for pid in remaining if _alive(pid)]
+        if remaining:
+            await asyncio.sleep(_EXIT_INTERVAL)
 
 
 def rpc_reachable(host: str, port: int, timeout: float = 1.5) -> bool:
@@ -229,18 +502,45 @@ def rpc_reachable(host: str, port: int, timeout: float = 1.5) -> bool:
             return False
 
 
-def _wait_for_rpc(host: str, port: int, timeout: float = 5.0, interval: float = 0.25) -> bool:
+# Readiness polling backs off 5 ms -> 200 ms: near-instant detection on a
+# warm start without hammering the socket when the daemon is genuinely slow.
+_WAIT_INITIAL = 0.005
+_WAIT_CAP = 0.2
+
+
+def _wait_for_rpc(host: str, port: int, timeout: float = 5.0) -> bool:
     """Poll RPC port until it opens or timeout expires."""
     deadline = time.time() + timeout
+    delay = _WAIT_INITIAL
     while time.time() < deadline:
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-            sock.settimeout(interval)
+            sock.settimeout(max(delay, 0.05))
             try:
                 sock.connect((host, port))
                 LOG.info("transmission-daemon RPC ready on %s:%s", host, port)
                 return True
             except OSError:
-                time.sleep(interval)
+                time.sleep(delay)
+                delay = min(delay * 2, _WAIT_CAP)
+    LOG.warning("transmission-daemon RPC did not open on %s:%s within %.1fs", host, port, timeout)
+    return False
+
+
+async def _wait_for_rpc_async(host: str, port: int, timeout: float = 5.0) -> bool:
+    """Async twin of :func:`_wait_for_rpc`; polls with ``asyncio.sleep``."""
+    deadline = time.time() + timeout
+    delay = _WAIT_INITIAL
+    while time.time() < deadline:
+        try:
+            _reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(host, port), max(delay, 0.05)
+            )
+            writer.close()
+            LOG.info("transmission-daemon RPC ready on %s:%s", host, port)
+            return True
+        except (OSError, asyncio.TimeoutError):
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _WAIT_CAP)
     LOG.warning("transmission-daemon RPC did not open on %s:%s within %.1fs", host, port, timeout)
     return False
 
@@ -6,8 +6,20 @@ from pathlib import Path
 from typing import Optional
 
 
+_FALSE_VALUES = frozenset({"", "0", "false", "no", "off"})
+
+
+def _env_bool(key: str, default: bool) -> bool:
+    value = os.environ.get(key)
+    if value is None:
+        return default
+    return value.strip().lower() not in _FALSE_VALUES
+
+
 DEFAULT_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
 DEFAULT_LEVEL = os.environ.get("TORSH_LOG_LEVEL", "INFO").upper()
+# Parsed once: the environment does not change under a running process.
+DEFAULT_TO_STDOUT = _env_bool("TORSH_LOG_TO_STDOUT", False)
 DEFAULT_LOG_PATH = Path(os.environ.get("TORSH_LOG_FILE", "") or (Path.home() / ".cache" / "torsh" / "debug.log"))
 
 
@@ -35,7 +47,7 @@ def configure_logger(
         return logger
 
     resolved_level = level or DEFAULT_LEVEL
-    resolved_stdout = to_stdout if to_stdout is not None else _env_bool("TORSH_LOG_TO_STDOUT", False)
+    resolved_stdout = to_stdout if to_stdout is not None else DEFAULT_TO_STDOUT
 
     logger.setLevel(resolved_level)
     handler = _build_handler(resolved_stdout, path)
@@ -44,19 +56,27 @@ def configure_logger(
     return logger
 
 
-def get_logger(name: str) -> logging.Logger:
-    """Backward-compatible entry point for the app."""
-    return configure_logger(name)
+_root_configured = False
 
 
-def setup_file_logger(path: Path) -> logging.Logger:
-    return configure_logger("torsh.file", to_stdout=False, path=path, level=DEFAULT_LEVEL)
+def _configure_root() -> None:
+    """Install one shared handler on the ``torsh`` logger, exactly once.
 
+    Child loggers propagate to it, so each module's ``get_logger`` costs a
+    dict lookup instead of opening its own file handler (and fd).
+    """
+    global _root_configured
+    if _root_configured:
+        return
+    configure_logger("torsh")
+    _root_configured = True
 
-def _env_bool(key: str, default: bool) -> bool:
-    value = os.environ.get(key)
-    if value is None:
-        return default
-    return value.strip().lower() not in {"", "0", "false", "no", "off"}
+
+def get_logger(name: str) -> logging.Logger:
+    """Backward-compatible entry point for the app."""
+    _configure_root()
+    return logging.getLogger(name)
 
 
+def setup_file_logger(path: Path) -> logging.Logger:
+    return configure_logger("torsh.file", to_stdout=False, path=path, level=DEFAULT_LEVEL)
@@ -6,9 +6,14 @@ A polished, feature-rich Textual-based torrent client UI.
 from __future__ import annotations
 
 import asyncio
+import functools
+import math
 import shutil
+import time
+from collections import deque
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, TypeVar
+from typing import Any, ClassVar, NamedTuple, TypeVar
 
 from rich.progress_bar import ProgressBar
 from rich.text import Text
@@ -31,9 +36,9 @@ from transmission_rpc.error import TransmissionError
 
 import humanize
 
-from ..client import TorrentView, TransmissionController
+from ..client import SessionStats, TorrentView, TransmissionController
 from ..config import AppConfig, save_config
-from ..daemon import maybe_start_daemon
+from ..daemon import maybe_start_daemon_async
 from ..logging import get_logger
 from .modals import (
     AddTorrentScreen,
@@ -59,6 +64,49 @@ def format_percent(value: float) -> str:
     return f"{value:5.1f}%"
 
 
+class RowSnap(NamedTuple):
+    """Rendered state of one table row.
+
+    A tuple compares element-wise in C and is far smaller than the dict it
+    replaces — one of these is allocated per torrent per refresh.
+    """
+
+    name: str
+    progress: float
+    eta: str
+    rate_down: str
+    rate_up: str
+    ratio: float
+    status: str
+    error: bool
+
+
+@functools.lru_cache(maxsize=8192)
+def _file_size(nbytes: int) -> str:
+    """Memoised ``humanize.naturalsize`` — file lengths never change."""
+    return humanize.naturalsize(nbytes, binary=True)
+
+
+# Sort keys by column number. attrgetter runs in C, so sorting skips a
+# Python frame per comparison element.
+_SORT_KEYS: dict[int, Any] = {
+    1: attrgetter("id"),
+    2: attrgetter("name_lower"),
+    3: attrgetter("percent_done"),
+    4: attrgetter("eta"),
+    5: attrgetter("rate_down"),
+    6: attrgetter("rate_up"),
+    7: attrgetter("ratio"),
+    8: attrgetter("status"),
+}
+
+
+@functools.lru_cache(maxsize=512)
+def _truncated(text: str, limit: int, cut: int) -> str:
+    """Memoised truncation; tracker hosts and statuses repeat every refresh."""
+    return text if len(text) <= limit else text[:cut] + "..."
+
+
 _STATUS_STYLES: dict[str, tuple[str, str]] = {
     "downloading": ("⬇", "bold green"),
     "seeding": ("⬆", "bold blue"),
@@ -73,18 +121,34 @@ _STATUS_STYLES: dict[str, tuple[str, str]] = {
 }
 
 
+# Prebuilt per status: styled_status runs once per row per refresh, so the
+# hot path is a dict lookup + copy instead of string interpolation.
+_STATUS_TEXTS: dict[str, Text] = {
+    status: Text(f"{icon} {status.title()}", style=style)
+    for status, (icon, style) in _STATUS_STYLES.items()
+}
+_ERROR_STATUS_TEXT = Text("⚠ Error", style="bold red")
+
+
 def styled_status(status: str, error: bool = False) -> Text:
     """Return a styled :class:`Text` for a torrent's status."""
     if error:
-        return Text("⚠ Error", style="bold red")
-    icon, style = _STATUS_STYLES.get(status.lower(), ("•", "default"))
-    return Text(f"{icon} {status.title()}", style=style)
+        return _ERROR_STATUS_TEXT.copy()
+    cached = _STATUS_TEXTS.get(status.lower())
+    if cached is not None:
+        return cached.copy()
+    return Text(f"• {status.title()}", style="default")
+
+
+@functools.lru_cache(maxsize=1024)
+def _ratio_text(label: str, style: str) -> Text:
+    return Text(label, style=style, justify="right")
 
 
 def styled_ratio(ratio: float) -> Text:
     """Return a styled Text object for ratio."""
     style = "bold green" if ratio >= 1.0 else "bold red"
-    return Text(f"{ratio:.2f}", style=style, justify="right")
+    return _ratio_text(f"{ratio:.2f}", style).copy()
 
 
 # =============================================================================
@@ -122,14 +186,14 @@ class TorshApp(App):
         Binding("j", "cursor_down", show=False),
         Binding("k", "cursor_up", show=False),
         Binding("G", "cursor_bottom", show=False),
-        Binding("1", "sort_1", show=False),
-        Binding("2", "sort_2", show=False),
-        Binding("3", "sort_3", show=False),
-        Binding("4", "sort_4", show=False),
-        Binding("5", "sort_5", show=False),
-        Binding("6", "sort_6", show=False),
-        Binding("7", "sort_7", show=False),
-        Binding("8", "sort_8", show=False),
+        Binding("1", "sort(1)", show=False),
+        Binding("2", "sort(2)", show=False),
+        Binding("3", "sort(3)", show=False),
+        Binding("4", "sort(4)", show=False),
+        Binding("5", "sort(5)", show=False),
+        Binding("6", "sort(6)", show=False),
+        Binding("7", "sort(7)", show=False),
+        Binding("8", "sort(8)", show=False),
     ]
 
     # Reactive state
@@ -152,20 +216,43 @@ class TorshApp(App):
         self.controller = TransmissionController(config)
         
         self.torrents: list[TorrentView] = []
+        self._torrents_by_id: dict[int, TorrentView] = {}
         self.filtered: list[TorrentView] = []
+        self._filtered_ids: set[int] = set()
         self.selected_id: int | None = None
         self.filter_text: str = config.ui.filter_text
+        self._filter_text_lower: str = self.filter_text.lower()
         
         self._refresh_timer: Any = None
+        self._effective_interval: float = 0.0
+        self._persist_timer: Any = None
+        self._disk_bar_obj: ProgressBar | None = None
+        self._last_disk: tuple[int, int] | None = None
+        self._last_disk_check: float = 0.0
         self._modal_depth: int = 0
-        self._speed_down_hist: list[float] = [0.0] * 60
-        self._speed_up_hist: list[float] = [0.0] * 60
+        # maxlen makes eviction O(1); list.pop(0) shifted 59 floats per tick.
+        self._speed_down_hist: deque[float] = deque([0.0] * 60, maxlen=60)
+        self._speed_up_hist: deque[float] = deque([0.0] * 60, maxlen=60)
+        # What the sparklines last received; idle ticks skip the widget update.
+        self._spark_down_pushed: list[float] = list(self._speed_down_hist)
+        self._spark_up_pushed: list[float] = list(self._speed_up_hist)
         self._completed_ids: set[int] = set()  # Track completed torrents
-        self._row_cache: dict[int, dict[str, Any]] = {}
+        self._sorted_cache: list[TorrentView] | None = None
+        self._by_id: dict[int, TorrentView] = {}
+        self._id_to_index: dict[int, int] = {}
+        self._row_cache: dict[int, RowSnap] = {}
         self._files_cache: dict[int, dict[str, Any]] = {}
         self._trackers_cache: dict[str, dict[str, Any]] = {}
+        # Row keys per table, maintained on add/remove instead of being
+        # rebuilt from ordered_rows on every render pass.
+        self._table_row_keys: dict[str, Any] = {}
+        self._last_row_order: tuple[str, ...] = ()
+        self._files_row_keys: dict[str, Any] = {}
+        self._trackers_row_keys: dict[str, Any] = {}
         self._files_torrent_id: int | None = None
         self._trackers_torrent_id: int | None = None
+        # () forces the first _render_details pass; None means "placeholder shown".
+        self._details_snap: tuple[Any, ...] | None = ()
         self._table_columns: dict[str, Any] = {}
         self._files_columns: dict[str, Any] = {}
         self._trackers_columns: dict[str, Any] = {}
@@ -204,10 +291,10 @@ class TorshApp(App):
                     yield Static("∞ / ∞", id="limit-badge")
                 with Horizontal(classes="stat-box"):
                     yield Label("↓ ", classes="stat-label")
-                    yield Sparkline(self._speed_down_hist, summary_function=max, classes="-download")
+                    yield Sparkline(self._spark_down_pushed, summary_function=max, classes="-download")
                 with Horizontal(classes="stat-box"):
                     yield Label("↑ ", classes="stat-label")
-                    yield Sparkline(self._speed_up_hist, summary_function=max, classes="-upload")
+                    yield Sparkline(self._spark_up_pushed, summary_function=max, classes="-upload")
 
         # Main content
         with Container(id="content"):
@@ -226,7 +313,7 @@ class TorshApp(App):
 
     async def on_mount(self) -> None:
         # Setup main table
-        table = self.query_one("#table", DataTable)
+        table = self._table = self.query_one("#table", DataTable)
         cols = table.add_columns(
             ("ID", "id"),
             ("Name", "name"),
@@ -249,7 +336,7 @@ class TorshApp(App):
         }
         
         # Setup files table
-        files_table = self.query_one("#files-table", DataTable)
+        files_table = self._files_table = self.query_one("#files-table", DataTable)
         file_cols = files_table.add_columns(
             ("Name", "name"),
             ("Size", "size"),
@@ -264,7 +351,7 @@ class TorshApp(App):
         }
         
         # Setup trackers table
-        trackers_table = self.query_one("#trackers-table", DataTable)
+        trackers_table = self._trackers_table = self.query_one("#trackers-table", DataTable)
         tracker_cols = trackers_table.add_columns(
             ("Host", "host"),
             ("Status", "status"),
@@ -280,9 +367,20 @@ class TorshApp(App):
             "leechers": tracker_cols[4],
         }
 
+        # Resolve hot-path widgets once; query_one walks the widget tree on
+        # every call and these are hit on each refresh tick.
+        self._tabbed = self.query_one(TabbedContent)
+        self._details_view = self.query_one("#details-view", Markdown)
+        self._status_bar = self.query_one("#status-bar", Static)
+        self._bindings_bar = self.query_one("#bindings-bar", Static)
+        self._limit_badge = self.query_one("#limit-badge", Static)
+        self._disk_bar = self.query_one("#disk-bar", Static)
+        self._spark_down = self.query_one("Sparkline.-download", Sparkline)
+        self._spark_up = self.query_one("Sparkline.-upload", Sparkline)
+
         # Initialize sparklines
-        self.query_one("Sparkline.-download", Sparkline).data = self._speed_down_hist
-        self.query_one("Sparkline.-upload", Sparkline).data = self._speed_up_hist
+        self._spark_down.data = self._spark_down_pushed
+        self._spark_up.data = self._spark_up_pushed
         
         self._set_refresh_interval(self.refresh_interval)
         await self.refresh_all()
@@ -319,43 +417,39 @@ class TorshApp(App):
         # Refresh rate
         parts.append(f"[dim]{self.refresh_interval:.1f}s[/]")
         
-        status_bar = self.query_one("#status-bar", Static)
-        status_bar.update(" │ ".join(parts))
-        self._update_bindings_bar()
+        self._status_bar.update(" │ ".join(parts))
+
+    # The hints never change at runtime, so the bar is rendered once from
+    # on_mount instead of on every status-bar refresh.
+    _BINDINGS_HINT: ClassVar[str] = (
+        "[bold cyan]a[/] Add  │ "
+        "[bold cyan]d[/] Del  │ "
+        "[bold cyan]x[/] Del keep  │ "
+        "[bold cyan]space[/] Pause/Start  │ "
+        "[bold cyan]v[/] Verify  │ "
+        "[bold cyan]g[/] Move  │ "
+        "[bold cyan]s[/] Speed  │ "
+        "[bold cyan]t[/] T-speed  │ "
+        "[bold cyan]p[/] Priority  │ "
+        "[bold cyan]/[/] Filter  │ "
+        "[bold cyan]c[/] Status  │ "
+        "[bold cyan]o[/] Progress  │ "
+        "[bold cyan]?[/] Help  │ "
+        "[bold cyan]q[/] Quit"
+    )
 
     def _update_bindings_bar(self) -> None:
         """Render one-line shortcut hints."""
-        hint = (
-            "[bold cyan]a[/] Add  │ "
-            "[bold cyan]d[/] Del  │ "
-            "[bold cyan]x[/] Del keep  │ "
-            "[bold cyan]space[/] Pause/Start  │ "
-            "[bold cyan]v[/] Verify  │ "
-            "[bold cyan]g[/] Move  │ "
-            "[bold cyan]s[/] Speed  │ "
-            "[bold cyan]t[/] T-speed  │ "
-            "[bold cyan]p[/] Priority  │ "
-            "[bold cyan]/[/] Filter  │ "
-            "[bold cyan]c[/] Status  │ "
-            "[bold cyan]o[/] Progress  │ "
-            "[bold cyan]?[/] Help  │ "
-            "[bold cyan]q[/] Quit"
-        )
         try:
-            self.query_one("#bindings-bar", Static).update(hint)
+            self._bindings_bar.update(self._BINDINGS_HINT)
         except Exception as exc:
-            LOG.debug(f"Failed to update bindings bar: {exc}")
+            LOG.debug("Failed to update bindings bar: %s", exc)
 
     def _update_limit_badge(self) -> None:
         """Update the header speed limit badge."""
-        try:
-            badge = self.query_one("#limit-badge", Static)
-        except Exception as exc:
-            LOG.debug(f"Failed to query limit badge: {exc}")
-            return
         limit_down = self._format_limit(self.global_speed_limit_down)
         limit_up = self._format_limit(self.global_speed_limit_up)
-        badge.update(f"↓ {limit_down} / ↑ {limit_up}")
+        self._limit_badge.update(f"↓ {limit_down} / ↑ {limit_up}")
 
     @staticmethod
     def _format_limit(value: int | None) -> str:
@@ -366,12 +460,41 @@ class TorshApp(App):
     # -------------------------------------------------------------------------
 
     def _set_refresh_interval(self, value: float) -> None:
-        if self._refresh_timer:
-            self._refresh_timer()
         value = max(0.8, min(10.0, value))
+        # Held-down ]/[ hits this once per keystroke; bail out when the
+        # clamped value is already in effect so neither the timer nor the
+        # config file gets churned.
+        if self._refresh_timer is not None and math.isclose(value, self.refresh_interval):
+            return
         self.refresh_interval = value
-        self._refresh_timer = self.set_interval(value, self.refresh_all)
-        self._persist_ui()
+        self._reschedule_refresh()
+        # Debounce the config write until the user stops adjusting.
+        if self._persist_timer is not None:
+            self._persist_timer.stop()
+        self._persist_timer = self.set_timer(0.3, self._persist_ui)
+
+    def _reschedule_refresh(self) -> None:
+        """(Re)start the refresh timer at the effective polling interval.
+
+        When nothing is downloading and the pipes are idle there is no
+        point polling at the user's fast cadence, so the timer backs off
+        to 4× the configured interval (capped at 10s) until activity
+        resumes.
+        """
+        target = self.refresh_interval
+        if not self._has_activity():
+            target = min(10.0, self.refresh_interval * 4)
+        if self._refresh_timer is not None and math.isclose(target, self._effective_interval):
+            return
+        if self._refresh_timer is not None:
+            self._refresh_timer.stop()
+        self._effective_interval = target
+        self._refresh_timer = self.set_interval(target, self.refresh_all)
+
+    def _has_activity(self) -> bool:
+        if self.download_speed > 0 or self.upload_speed > 0:
+            return True
+        return any(t.status == "downloading" for t in self.torrents)
 
     async def refresh_all(self) -> None:
         # Skip auto-refresh while a modal is open so we never touch detached
@@ -380,11 +503,19 @@ class TorshApp(App):
             return
         if not await self._check_connection():
             return
-        await asyncio.gather(
-            self._refresh_torrents(),
-            self._refresh_stats(),
-        )
+        try:
+            torrents, stats, limits = await self.controller.snapshot()
+        except Exception as exc:
+            if not self._last_refresh_error:
+                self.notify(f"⚠️ Refresh error: {exc}", severity="error")
+            self._last_refresh_error = True
+            LOG.error(f"Refresh error: {exc}")
+            return
+        self._last_refresh_error = False
+        await self._refresh_torrents(torrents)
+        self._refresh_stats(stats, limits)
         self._update_status_bar()
+        self._reschedule_refresh()
 
     async def _check_connection(self) -> bool:
         previous_state = self._connection_state
@@ -398,7 +529,7 @@ class TorshApp(App):
         except Exception:
             self.connection_ok = False
             if self.config.daemon.restart_on_fail and self.config.daemon.autostart:
-                maybe_start_daemon(self.config)
+                await maybe_start_daemon_async(self.config)
                 await asyncio.sleep(1.5)
                 try:
                     await self.controller.ensure_connected()
@@ -406,7 +537,7 @@ class TorshApp(App):
                     self.notify("🔄 Daemon restarted", severity="warning")
                     connected = True
                 except Exception as restart_exc:
-                    LOG.debug(f"Daemon restart failed: {restart_exc}")
+                    LOG.debug("Daemon restart failed: %s", restart_exc)
         if self.connection_ok != previous_state:
             self._notify_connection_change(self.connection_ok)
         self._connection_state = self.connection_ok
@@ -429,7 +560,7 @@ class TorshApp(App):
             self._verified_ids.add(torrent_id)
             self.notify(f"✅ Verified: {name[:30]}", severity="information")
         except Exception as exc:
-            LOG.debug(f"Auto-verify failed for {torrent_id}: {exc}")
+            LOG.debug("Auto-verify failed for %s: %s", torrent_id, exc)
 
     async def _auto_retry_failed(self, torrents: list[TorrentView]) -> None:
         """Auto-retry torrents that are in error state."""
@@ -443,7 +574,7 @@ class TorshApp(App):
                     await self.controller.start([t.id])
                     self.notify(f"🔁 Retry #{attempts + 1}: {t.name[:30]}", severity="warning")
                 except Exception as exc:
-                    LOG.debug(f"Auto-retry failed for {t.id}: {exc}")
+                    LOG.debug("Auto-retry failed for %s: %s", t.id, exc)
             else:
                 if t.id in self._auto_retry_attempts:
                     self._auto_retry_attempts.pop(t.id, None)
@@ -465,21 +596,29 @@ class TorshApp(App):
                 self._auto_started.add(tid)
             self.notify(f"▶ Auto-started {len(to_start)} torrent(s)", severity="information")
         except Exception as exc:
-            LOG.debug(f"Auto-resume failed: {exc}")
+            LOG.debug("Auto-resume failed: %s", exc)
 
-    async def _refresh_torrents(self) -> None:
+    async def _refresh_torrents(self, torrents: list[TorrentView]) -> None:
         try:
-            old_torrents = {t.id: t for t in self.torrents}
-            self.torrents = await self.controller.list_torrents()
-            
-            # Check for newly completed downloads
-            for t in self.torrents:
-                if t.percent_done >= 100.0 and t.id not in self._completed_ids:
-                    if t.id in old_torrents and old_torrents[t.id].percent_done < 100.0:
-                        self.notify(f"✅ Completed: {t.name[:30]}", severity="information")
-                    self._completed_ids.add(t.id)
-                    await self._auto_verify(t.id, t.name)
-            
+            old_torrents = self._torrents_by_id
+            self.torrents = torrents
+            self._torrents_by_id = {t.id: t for t in torrents}
+
+            # Check for newly completed downloads; the verifies run
+            # concurrently instead of serialising one RPC per completion.
+            newly_completed = [
+                t for t in self.torrents
+                if t.percent_done >= 100.0 and t.id not in self._completed_ids
+            ]
+            for t in newly_completed:
+                prev = old_torrents.get(t.id)
+                if prev is not None and prev.percent_done < 100.0:
+                    self.notify(f"✅ Completed: {t.name[:30]}", severity="information")
+            self._completed_ids.update(t.id for t in newly_completed)
+            if newly_completed:
+                await asyncio.gather(*(self._auto_verify(t.id, t.name) for t in newly_completed))
+
+
             self._apply_filter()
             await self._auto_retry_failed(self.torrents)
             await self._auto_resume(self.torrents)
@@ -491,23 +630,33 @@ class TorshApp(App):
             self._last_refresh_error = True
             LOG.error(f"Refresh error: {exc}")
 
-    async def _refresh_stats(self) -> None:
+    def _set_if_changed(self, attr: str, value: Any) -> None:
+        """Assign a reactive only when the value actually changed.
+
+        Reactive setters re-run watchers and dirty bound widgets even for
+        no-op assignments, which repainted the header box every tick on an
+        idle client.
+        """
+        current = getattr(self, attr)
+        if isinstance(value, float):
+            if isinstance(current, (int, float)) and math.isclose(current, value):
+                return
+        elif current == value:
+            return
+        setattr(self, attr, value)
+
+    def _refresh_stats(self, stats: SessionStats, limits: dict[str, int]) -> None:
         try:
-            stats = await self.controller.session_stats()
-            self.download_speed = (getattr(stats, "download_speed", 0) or 0) / 1024
-            self.upload_speed = (getattr(stats, "upload_speed", 0) or 0) / 1024
+            self._set_if_changed("download_speed", stats.download_speed / 1024)
+            self._set_if_changed("upload_speed", stats.upload_speed / 1024)
             self._append_speed(self.download_speed, self.upload_speed)
-            self.active_count = getattr(stats, "active_torrent_count", 0) or 0
-            self.paused_count = getattr(stats, "paused_torrent_count", 0) or 0
+            self._set_if_changed("active_count", stats.active_torrent_count)
+            self._set_if_changed("paused_count", stats.paused_torrent_count)
             self._update_disk()
             self._render_disk_bar()
-            try:
-                limits = await self.controller.get_speed_limits()
-                self.global_speed_limit_down = limits.get("down", 0)
-                self.global_speed_limit_up = limits.get("up", 0)
-                self._update_limit_badge()
-            except Exception as limits_error:
-                LOG.debug(f"Speed limits fetch failed: {limits_error}")
+            self._set_if_changed("global_speed_limit_down", limits.get("down", 0))
+            self._set_if_changed("global_speed_limit_up", limits.get("up", 0))
+            self._update_limit_badge()
         except Exception as exc:
             LOG.error(f"Stats error: {exc}")
 
@@ -516,48 +665,67 @@ class TorshApp(App):
     # -------------------------------------------------------------------------
 
     def _render_table(self) -> None:
-        table = self.query_one("#table", DataTable)
-        data = self._sorted(self.filtered or self.torrents)
+        table = self._table
+        data = self._sorted_view()
         desired_keys = [str(t.id) for t in data]
 
-        # Remove rows that disappeared
-        for row in list(table.ordered_rows):
-            if row.key.value not in desired_keys:
-                table.remove_row(row.key)
-                self._row_cache.pop(int(row.key.value), None)
-
-        row_key_map = {row.key.value: row.key for row in table.ordered_rows}
-
-        for torrent in data:
-            cells, snapshot = self._torrent_cells(torrent)
-            key_str = str(torrent.id)
-            row_key = row_key_map.get(key_str)
-            if row_key is None:
-                row_key = table.add_row(*cells, key=key_str)
-                row_key_map[key_str] = row_key
-            else:
-                cached = self._row_cache.get(torrent.id)
-                if cached != snapshot:
-                    self._update_torrent_row(table, row_key, cells, cached, snapshot)
-            self._row_cache[torrent.id] = snapshot
+        # One repaint per tick: without batching every add/remove/update_cell
+        # triggers its own DataTable re-layout, O(rows × cols) per refresh.
+        with self.batch_update():
+            # Remove rows that disappeared
+            row_key_map = self._table_row_keys
+            desired_set = set(desired_keys)
+            for key_str in [k for k in row_key_map if k not in desired_set]:
+                table.remove_row(row_key_map.pop(key_str))
+                self._row_cache.pop(int(key_str), None)
+
+            for torrent in data:
+                # Snapshot first: for an unchanged row (the common case) no
+                # Rich Text/ProgressBar objects are built at all.
+                snapshot = self._torrent_snapshot(torrent)
+                key_str = str(torrent.id)
+                row_key = row_key_map.get(key_str)
+                if row_key is None:
+                    row_key = table.add_row(*self._torrent_cells(torrent), key=key_str)
+                    row_key_map[key_str] = row_key
+                else:
+                    cached = self._row_cache.get(torrent.id)
+                    if cached == snapshot:
+                        continue
+                    self._update_torrent_row(table, row_key, self._torrent_cells(torrent), cached, snapshot)
+                self._row_cache[torrent.id] = snapshot
+
+            self._apply_row_order(table, desired_keys)
+
+            if self.selected_id is not None:
+                idx = self._find_row_index(self.selected_id)
+                if idx is not None:
+                    table.cursor_coordinate = (idx, 0)
+                else:
+                    self.selected_id = None
 
-        self._apply_row_order(table, desired_keys)
+            if self.selected_id is None and data:
+                self.selected_id = data[0].id
+                table.cursor_coordinate = (0, 0)
 
-        if self.selected_id is not None:
-            idx = self._find_row_index(self.selected_id, data)
-            if idx is not None:
-                table.cursor_coordinate = (idx, 0)
-            else:
-                self.selected_id = None
-        
-        if self.selected_id is None and data:
-            self.selected_id = data[0].id
-            table.cursor_coordinate = (0, 0)
-        
         self._render_details()
 
-    def _torrent_cells(self, torrent: TorrentView) -> tuple[tuple[Any, ...], dict[str, Any]]:
-        """Build renderable cells and a lightweight snapshot for diff updates."""
+    @staticmethod
+    def _torrent_snapshot(torrent: TorrentView) -> RowSnap:
+        """Lightweight snapshot used to diff a row before building cells."""
+        return RowSnap(
+            name=torrent.name,
+            progress=round(torrent.percent_done, 2),
+            eta=torrent.eta,
+            rate_down=torrent.rate_down,
+            rate_up=torrent.rate_up,
+            ratio=round(torrent.ratio, 3),
+            status=torrent.status,
+            error=torrent.error,
+        )
+
+    def _torrent_cells(self, torrent: TorrentView) -> tuple[Any, ...]:
+        """Build the renderable cells for one table row."""
         progress_bar = ProgressBar(
             total=100.0,
             completed=torrent.percent_done,
@@ -569,7 +737,7 @@ class TorshApp(App):
         down_style = "dim" if torrent.rate_down.startswith("0 ") else "bold green"
         up_style = "dim" if torrent.rate_up.startswith("0 ") else "bold blue"
 
-        cells = (
+        return (
             Text(str(torrent.id), justify="right"),
             Text(torrent.name, overflow="ellipsis", no_wrap=True),
             progress_bar,
@@ -579,43 +747,28 @@ class TorshApp(App):
             styled_ratio(torrent.ratio),
             styled_status(torrent.status, torrent.error),
         )
-        snapshot = {
-            "name": torrent.name,
-            "progress": round(torrent.percent_done, 2),
-            "eta": torrent.eta,
-            "rate_down": torrent.rate_down,
-            "rate_up": torrent.rate_up,
-            "ratio": round(torrent.ratio, 3),
-            "status": torrent.status,
-            "error": torrent.error,
-        }
-        return cells, snapshot
 
     def _update_torrent_row(
         self,
         table: DataTable,
         row_key: Any,
         cells: tuple[Any, ...],
-        cached: dict[str, Any] | None,
-        snapshot: dict[str, Any],
+        cached: RowSnap | None,
+        snapshot: RowSnap,
     ) -> None:
         """Update only the cells that actually changed."""
-
-        def changed(field: str) -> bool:
-            return cached is None or cached.get(field) != snapshot[field]
-
-        if changed("name"):
+        if cached is None or cached.name != snapshot.name:
             table.update_cell(row_key, self._table_columns["name"], cells[1])
-        if changed("progress") or changed("eta"):
+        if cached is None or cached.progress != snapshot.progress or cached.eta != snapshot.eta:
             table.update_cell(row_key, self._table_columns["progress"], cells[2])
             table.update_cell(row_key, self._table_columns["eta"], cells[3])
-        if changed("rate_down"):
+        if cached is None or cached.rate_down != snapshot.rate_down:
             table.update_cell(row_key, self._table_columns["down"], cells[4])
-        if changed("rate_up"):
+        if cached is None or cached.rate_up != snapshot.rate_up:
             table.update_cell(row_key, self._table_columns["up"], cells[5])
-        if changed("ratio"):
+        if cached is None or cached.ratio != snapshot.ratio:
             table.update_cell(row_key, self._table_columns["ratio"], cells[6])
-        if changed("status") or changed("error"):
+        if cached is None or cached.status != snapshot.status or cached.error != snapshot.error:
             table.update_cell(row_key, self._table_columns["status"], cells[7])
 
     def _apply_row_order(self, table: DataTable, desired_keys: list[str], *, column: str = "id") -> None:
@@ -627,6 +780,11 @@ class TorshApp(App):
         """
         if not desired_keys:
             return
+        # DataTable.sort walks every row; skip it when the order last applied
+        # is still the one we want (the common case between data changes).
+        key_tuple = tuple(desired_keys)
+        if key_tuple == self._last_row_order:
+            return
         positions = {key: idx for idx, key in enumerate(desired_keys)}
         fallback = len(positions)
         try:
@@ -636,29 +794,49 @@ class TorshApp(App):
             )
         except Exception as exc:
             LOG.debug("Row reorder skipped: %s", exc)
+        else:
+            self._last_row_order = key_tuple
 
-    def _find_row_index(self, torrent_id: int, data: list[TorrentView]) -> int | None:
-        for idx, t in enumerate(data):
-            if t.id == torrent_id:
-                return idx
-        return None
+    def _find_row_index(self, torrent_id: int) -> int | None:
+        return self._id_to_index.get(torrent_id)
 
     def _render_details(self) -> None:
-        details = self.query_one("#details-view", Markdown)
-        data = self._sorted(self.filtered or self.torrents)
-        torrent = next((t for t in data if t.id == self.selected_id), None)
+        details = self._details_view
+        self._sorted_view()  # make sure _by_id reflects the current data
+        torrent = self._by_id.get(self.selected_id) if self.selected_id is not None else None
         
         if torrent:
             if self._files_torrent_id != torrent.id:
                 self._files_torrent_id = torrent.id
                 self._files_cache.clear()
-                self.query_one("#files-table", DataTable).clear()
+                self._files_row_keys.clear()
+                self._files_table.clear()
             if self._trackers_torrent_id != torrent.id:
                 self._trackers_torrent_id = torrent.id
                 self._trackers_cache.clear()
-                self.query_one("#trackers-table", DataTable).clear()
-            status_label = styled_status(torrent.status, torrent.error).plain
-            md = f"""
+                self._trackers_row_keys.clear()
+                self._trackers_table.clear()
+            # Markdown.update reparses the whole blob; skip it when nothing
+            # about the visible torrent changed since the last render.
+            snap = (
+                torrent.id,
+                torrent.name,
+                round(torrent.percent_done, 1),
+                torrent.size,
+                round(torrent.ratio, 2),
+                torrent.eta,
+                torrent.peers,
+                torrent.seeders,
+                torrent.leechers,
+                torrent.download_dir,
+                torrent.status,
+                torrent.error,
+                torrent.error_string,
+            )
+            if snap != self._details_snap:
+                self._details_snap = snap
+                status_label = styled_status(torrent.status, torrent.error).plain
+                md = f"""
 ## {torrent.name}
 
 | Property | Value |
@@ -671,184 +849,222 @@ class TorshApp(App):
 | Peers | {torrent.peers} (S:{torrent.seeders}/L:{torrent.leechers}) |
 | Path | `{torrent.download_dir}` |
 """
-            if torrent.error and torrent.error_string:
-                md += f"\n> ⚠️ **Error:** {torrent.error_string}\n"
-            details.update(md)
+                if torrent.error and torrent.error_string:
+                    md += f"\n> ⚠️ **Error:** {torrent.error_string}\n"
+                details.update(md)
             asyncio.create_task(self._update_files_tab(torrent.id))
             asyncio.create_task(self._update_trackers_tab(torrent.id))
-        else:
+        elif self._details_snap is not None:
+            self._details_snap = None
             details.update("_Select a torrent to view details_")
-            self.query_one("#files-table", DataTable).clear()
-            self.query_one("#trackers-table", DataTable).clear()
+            self._files_table.clear()
+            self._trackers_table.clear()
             self._files_cache.clear()
             self._trackers_cache.clear()
+            self._files_row_keys.clear()
+            self._trackers_row_keys.clear()
             self._files_torrent_id = None
             self._trackers_torrent_id = None
 
     async def _update_files_tab(self, torrent_id: int) -> None:
-        tabbed = self.query_one(TabbedContent)
-        if tabbed.active != "files":
+        if self._tabbed.active != "files":
             return
         
         try:
             files = await self.controller.get_files(torrent_id)
             if files is None:
                 return
-            ft = self.query_one("#files-table", DataTable)
-
-            if self._files_torrent_id != torrent_id:
-                ft.clear()
-                self._files_cache.clear()
-                self._files_torrent_id = torrent_id
-
-            desired_keys = [str(idx) for idx in sorted(files.keys())]
-
-            # Remove missing rows
-            for row in list(ft.ordered_rows):
-                if row.key.value not in desired_keys:
-                    ft.remove_row(row.key)
-                    self._files_cache.pop(int(row.key.value), None)
-
-            row_key_map = {row.key.value: row.key for row in ft.ordered_rows}
-
-            for idx, f in sorted(files.items()):
-                size = humanize.naturalsize(f.get("length", 0), binary=True)
-                completed = f.get("bytesCompleted", 0)
-                length = f.get("length", 1)
-                percent = (completed / length) * 100 if length > 0 else 0
-                pri = f.get("priority", 0)
-                pri_icon = "⬆" if pri > 0 else ("⬇" if pri < 0 else "―")
-
-                cells = (
-                    Text(f.get("name", "Unknown"), overflow="ellipsis"),
-                    Text(size, justify="right"),
-                    Text(format_percent(percent), justify="right"),
-                    Text(pri_icon, justify="center"),
-                )
-                snapshot = {
-                    "name": f.get("name", "Unknown"),
-                    "size": size,
-                    "percent": round(percent, 2),
-                    "priority": pri,
-                }
-                key_str = str(idx)
-                row_key = row_key_map.get(key_str)
-                if row_key is None:
-                    row_key = ft.add_row(*cells, key=key_str)
-                    row_key_map[key_str] = row_key
-                else:
+            ft = self._files_table
+
+            with self.batch_update():
+                row_key_map = self._files_row_keys
+                if self._files_torrent_id != torrent_id:
+                    ft.clear()
+                    self._files_cache.clear()
+                    row_key_map.clear()
+                    self._files_torrent_id = torrent_id
+
+                # Remove missing rows
+                desired_set = {str(idx) for idx in files}
+                for key_str in [k for k in row_key_map if k not in desired_set]:
+                    ft.remove_row(row_key_map.pop(key_str))
+                    self._files_cache.pop(int(key_str), None)
+
+                for idx, f in sorted(files.items()):
+                    name = f.get("name", "Unknown")
+                    completed = f.get("bytesCompleted", 0)
+                    length = f.get("length", 1)
+                    pri = f.get("priority", 0)
+
+                    # Raw snapshot first: only a handful of files gain bytes
+                    # per tick, so most rows skip formatting entirely.
+                    snapshot = {
+                        "name": name,
+                        "length": length,
+                        "completed": completed,
+                        "priority": pri,
+                    }
+                    key_str = str(idx)
+                    row_key = row_key_map.get(key_str)
                     cached = self._files_cache.get(idx)
-                    if cached != snapshot:
-                        if cached is None or cached.get("name") != snapshot["name"]:
+                    if row_key is not None and cached == snapshot:
+                        continue
+
+                    percent = (completed / length) * 100 if length > 0 else 0
+                    pri_icon = "⬆" if pri > 0 else ("⬇" if pri < 0 else "―")
+                    cells = (
+                        Text(name, overflow="ellipsis"),
+                        Text(_file_size(f.get("length", 0)), justify="right"),
+                        Text(format_percent(percent), justify="right"),
+                        Text(pri_icon, justify="center"),
+                    )
+                    if row_key is None:
+                        row_key = ft.add_row(*cells, key=key_str)
+                        row_key_map[key_str] = row_key
+                    else:
+                        if cached is None or cached.get("name") != name:
                             ft.update_cell(row_key, self._files_columns["name"], cells[0])
-                        if cached is None or cached.get("size") != snapshot["size"]:
+                        if cached is None or cached.get("length") != length:
                             ft.update_cell(row_key, self._files_columns["size"], cells[1])
-                        if cached is None or cached.get("percent") != snapshot["percent"]:
+                        if cached is None or cached.get("completed") != completed or cached.get("length") != length:
                             ft.update_cell(row_key, self._files_columns["done"], cells[2])
-                        if cached is None or cached.get("priority") != snapshot["priority"]:
+                        if cached is None or cached.get("priority") != pri:
                             ft.update_cell(row_key, self._files_columns["priority"], cells[3])
-                self._files_cache[idx] = snapshot
+                    self._files_cache[idx] = snapshot
         except Exception as exc:
-            LOG.debug(f"Files tab update skipped: {exc}")
+            LOG.debug("Files tab update skipped: %s", exc)
+
+    # Snapshot key -> position in the tracker cells tuple (and column dict).
+    _TRACKER_FIELD_INDEX: ClassVar[dict[str, int]] = {
+        "host": 0,
+        "status": 1,
+        "peers": 2,
+        "seeders": 3,
+        "leechers": 4,
+    }
 
     async def _update_trackers_tab(self, torrent_id: int) -> None:
         """Update the trackers table for the selected torrent."""
-        tabbed = self.query_one(TabbedContent)
-        if tabbed.active != "trackers":
+        if self._tabbed.active != "trackers":
             return
         
         try:
             trackers = await self.controller.get_trackers(torrent_id)
-            tt = self.query_one("#trackers-table", DataTable)
-
-            if self._trackers_torrent_id != torrent_id:
-                tt.clear()
-                self._trackers_cache.clear()
-                self._trackers_torrent_id = torrent_id
-
-            desired_keys = [f"{idx}-{t.get('host', 'unknown')}" for idx, t in enumerate(trackers)]
-
-            for row in list(tt.ordered_rows):
-                if row.key.value not in desired_keys:
-                    tt.remove_row(row.key)
-                    self._trackers_cache.pop(row.key.value, None)
-
-            row_key_map = {row.key.value: row.key for row in tt.ordered_rows}
-
-            for idx, tracker in enumerate(trackers):
-                host = tracker.get("host", "unknown")
-                if len(host) > 30:
-                    host = host[:27] + "..."
-                status = tracker.get("status", "")
-                if len(status) > 15:
-                    status = status[:12] + "..."
-                
-                if "success" in status.lower() or status == "":
-                    status_text = Text(status or "OK", style="green")
-                elif "error" in status.lower():
-                    status_text = Text(status, style="red")
-                else:
-                    status_text = Text(status, style="yellow")
-                
-                cells = (
-                    Text(host),
-                    status_text,
-                    Text(str(tracker.get("peers", 0)), justify="right"),
-                    Text(str(tracker.get("seeders", 0)), justify="right"),
-                    Text(str(tracker.get("leechers", 0)), justify="right"),
-                )
-                key_str = f"{idx}-{tracker.get('host', 'unknown')}"
-                snapshot = {
-                    "host": host,
-                    "status": status_text.plain,
-                    "peers": tracker.get("peers", 0),
-                    "seeders": tracker.get("seeders", 0),
-                    "leechers": tracker.get("leechers", 0),
-                }
-                row_key = row_key_map.get(key_str)
-                if row_key is None:
-                    row_key = tt.add_row(*cells, key=key_str)
-                    row_key_map[key_str] = row_key
-                else:
+            tt = self._trackers_table
+
+            with self.batch_update():
+                row_key_map = self._trackers_row_keys
+                if self._trackers_torrent_id != torrent_id:
+                    tt.clear()
+                    self._trackers_cache.clear()
+                    row_key_map.clear()
+                    self._trackers_torrent_id = torrent_id
+
+                desired_set = {f"{idx}-{t.get('host', 'unknown')}" for idx, t in enumerate(trackers)}
+                for key_str in [k for k in row_key_map if k not in desired_set]:
+                    tt.remove_row(row_key_map.pop(key_str))
+                    self._trackers_cache.pop(key_str, None)
+
+                for idx, tracker in enumerate(trackers):
+                    raw_host = tracker.get("host", "unknown")
+                    raw_status = tracker.get("status", "")
+                    peers = tracker.get("peers", 0)
+                    seeders = tracker.get("seeders", 0)
+                    leechers = tracker.get("leechers", 0)
+
+                    # Raw snapshot first — tracker rows barely change between
+                    # announces, so most ticks skip all Text construction.
+                    snapshot = {
+                        "host": raw_host,
+                        "status": raw_status,
+                        "peers": peers,
+                        "seeders": seeders,
+                        "leechers": leechers,
+                    }
+                    key_str = f"{idx}-{raw_host}"
+                    row_key = row_key_map.get(key_str)
                     cached = self._trackers_cache.get(key_str)
-                    if cached != snapshot:
-                        if cached is None or cached.get("host") != snapshot["host"]:
-                            tt.update_cell(row_key, self._trackers_columns["host"], cells[0])
-                        if cached is None or cached.get("status") != snapshot["status"]:
-                            tt.update_cell(row_key, self._trackers_columns["status"], cells[1])
-                        if cached is None or cached.get("peers") != snapshot["peers"]:
-                            tt.update_cell(row_key, self._trackers_columns["peers"], cells[2])
-                        if cached is None or cached.get("seeders") != snapshot["seeders"]:
-                            tt.update_cell(row_key, self._trackers_columns["seeders"], cells[3])
-                        if cached is None or cached.get("leechers") != snapshot["leechers"]:
-                            tt.update_cell(row_key, self._trackers_columns["leechers"], cells[4])
-                self._trackers_cache[key_str] = snapshot
+                    if row_key is not None and cached == snapshot:
+                        continue
+
+                    host = _truncated(raw_host, 30, 27)
+                    status = _truncated(raw_status, 15, 12)
+                    if "success" in status.lower() or status == "":
+                        status_text = Text(status or "OK", style="green")
+                    elif "error" in status.lower():
+                        status_text = Text(status, style="red")
+                    else:
+                        status_text = Text(status, style="yellow")
+
+                    cells = (
+                        Text(host),
+                        status_text,
+                        Text(str(peers), justify="right"),
+                        Text(str(seeders), justify="right"),
+                        Text(str(leechers), justify="right"),
+                    )
+                    if row_key is None:
+                        row_key = tt.add_row(*cells, key=key_str)
+                        row_key_map[key_str] = row_key
+                    else:
+                        if cached is None:
+                            changed = snapshot.keys()
+                        else:
+                            changed = [k for k, v in snapshot.items() if cached.get(k) != v]
+                        for k in changed:
+                            tt.update_cell(
+                                row_key,
+                                self._trackers_columns[k],
+                                cells[self._TRACKER_FIELD_INDEX[k]],
+                            )
+                    self._trackers_cache[key_str] = snapshot
         except Exception as exc:
-            LOG.debug(f"Trackers tab update skipped: {exc}")
+            LOG.debug("Trackers tab update skipped: %s", exc)
 
     def _render_disk_bar(self) -> None:
-        disk_bar = self.query_one("#disk-bar", Static)
-        if self.disk_total > 0:
-            used = self.disk_total - self.disk_free
-            bar = ProgressBar(
+        if self.disk_total <= 0:
+            return
+        used = self.disk_total - self.disk_free
+        # Disk numbers move rarely; reuse one ProgressBar and skip the
+        # Static repaint when nothing changed.
+        if (used, self.disk_total) == self._last_disk:
+            return
+        self._last_disk = (used, self.disk_total)
+        bar = self._disk_bar_obj
+        if bar is None:
+            bar = self._disk_bar_obj = ProgressBar(
                 total=float(self.disk_total),
                 completed=float(used),
                 width=15,
                 complete_style="blue",
                 finished_style="blue",
             )
-            disk_bar.update(bar)
+        else:
+            bar.update(float(used), total=float(self.disk_total))
+        self._disk_bar.update(bar)
 
     def _append_speed(self, down: float, up: float) -> None:
         self._speed_down_hist.append(down)
         self._speed_up_hist.append(up)
-        if len(self._speed_down_hist) > 60:
-            self._speed_down_hist.pop(0)
-            self._speed_up_hist.pop(0)
-        self.query_one("Sparkline.-download", Sparkline).data = self._speed_down_hist
-        self.query_one("Sparkline.-upload", Sparkline).data = self._speed_up_hist
+        # Reassigning Sparkline.data re-diffs all 60 samples; on an idle
+        # client the history is flat, so skip the widget when it matches.
+        down_data = list(self._speed_down_hist)
+        if down_data != self._spark_down_pushed:
+            self._spark_down_pushed = down_data
+            self._spark_down.data = down_data
+        up_data = list(self._speed_up_hist)
+        if up_data != self._spark_up_pushed:
+            self._spark_up_pushed = up_data
+            self._spark_up.data = up_data
+
+    # Free space moves slowly; one statvfs every few seconds is plenty.
+    _DISK_POLL_SECONDS: ClassVar[float] = 5.0
 
     def _update_disk(self) -> None:
+        now = time.monotonic()
+        if now - self._last_disk_check < self._DISK_POLL_SECONDS:
+            return
+        self._last_disk_check = now
         try:
             usage = shutil.disk_usage(self.config.paths.download_dir)
             self.disk_free = usage.free
@@ -861,49 +1077,76 @@ class TorshApp(App):
     # Filtering & Sorting
     # -------------------------------------------------------------------------
 
+    _ACTIVE_STATUSES: ClassVar[frozenset[str]] = frozenset({"downloading", "seeding", "checking"})
+    _PAUSED_STATUSES: ClassVar[frozenset[str]] = frozenset({"stopped", "paused"})
+
     def _apply_filter(self) -> None:
-        text = self.filter_text.lower()
-        self.filtered = []
-        
+        # Resolve the dropdown filters into plain data once, so the loop
+        # below runs straight-line checks instead of re-branching on the
+        # same filter value for every torrent.
+        text = self._filter_text_lower
+        status_value = self.status_filter_value
+        status_ok: frozenset[str] | None = None
+        if status_value == "active":
+            status_ok = self._ACTIVE_STATUSES
+        elif status_value == "paused":
+            status_ok = self._PAUSED_STATUSES
+        errors_only = status_value == "error"
+        progress_value = self.progress_filter_value
+        done_only = progress_value == "done"
+        under50_only = progress_value == "under50"
+
+        filtered = []
         for t in self.torrents:
-            if text and text not in t.name.lower():
+            if text and text not in t.name_lower:
                 continue
-            if self.status_filter_value == "active":
-                if t.status not in ("downloading", "seeding", "checking"):
-                    continue
-            elif self.status_filter_value == "paused":
-                if t.status not in ("stopped", "paused"):
-                    continue
-            elif self.status_filter_value == "error":
-                if not t.error:
-                    continue
-            if self.progress_filter_value == "done":
-                if t.percent_done < 99.9:
-                    continue
-            elif self.progress_filter_value == "under50":
-                if t.percent_done >= 50.0:
-                    continue
-            self.filtered.append(t)
-        
-        if self.selected_id is not None:
-            if all(t.id != self.selected_id for t in self.filtered):
-                self.selected_id = self.filtered[0].id if self.filtered else None
+            if status_ok is not None and t.status not in status_ok:
+                continue
+            if errors_only and not t.error:
+                continue
+            if done_only and t.percent_done < 99.9:
+                continue
+            if under50_only and t.percent_done >= 50.0:
+                continue
+            filtered.append(t)
+        self.filtered = filtered
+        self._filtered_ids = {t.id for t in filtered}
+
+        if self.selected_id is not None and self.selected_id not in self._filtered_ids:
+            self.selected_id = filtered[0].id if filtered else None
+
+        self._sorted_cache = None
+
+    def _sorted_view(self) -> list[TorrentView]:
+        """Sorted torrents for display, recomputed only when data or sort changed.
+
+        Both the table and the details pane need this list every tick;
+        caching it halves the O(N log N) sort work and gives ``_by_id``
+        O(1) lookups instead of linear scans.
+        """
+        if self._sorted_cache is None:
+            cache = self._sorted(self.filtered or self.torrents)
+            self._sorted_cache = cache
+            self._by_id = {t.id: t for t in cache}
+            self._id_to_index = {t.id: i for i, t in enumerate(cache)}
+        return self._sorted_cache
+
+    def watch_sort_column(self, _value: int | None) -> None:
+        self._sorted_cache = None
+
+    def watch_sort_desc(self, _value: bool) -> None:
+        self._sorted_cache = None
 
     def _sorted(self, data: list[TorrentView]) -> list[TorrentView]:
         if self.sort_column is None:
             return data
-        key_funcs = {
-            1: lambda t: t.id,
-            2: lambda t: t.name.lower(),
-            3: lambda t: t.percent_done,
-            4: lambda t: t.eta,
-            5: lambda t: t.rate_down,
-            6: lambda t: t.rate_up,
-            7: lambda t: t.ratio,
-            8: lambda t: t.status,
-        }
-        key = key_funcs.get(self.sort_column, lambda t: t.id)
-        return sorted(data, key=key, reverse=self.sort_desc)
+        getter = _SORT_KEYS.get(self.sort_column, _SORT_KEYS[1])
+        # Decorate-sort-undecorate: map() extracts every key in C up front,
+        # and the sort itself compares plain values through list.__getitem__
+        # rather than calling the key function per element.
+        keys = list(map(getter, data))
+        order = sorted(range(len(data)), key=keys.__getitem__, reverse=self.sort_desc)
+        return [data[i] for i in order]
 
     def _set_sort(self, col: int) -> None:
         if self.sort_column == col:
@@ -918,13 +1161,13 @@ class TorshApp(App):
     # -------------------------------------------------------------------------
 
     def action_cursor_down(self) -> None:
-        self.query_one("#table", DataTable).action_cursor_down()
+        self._table.action_cursor_down()
 
     def action_cursor_up(self) -> None:
-        self.query_one("#table", DataTable).action_cursor_up()
+        self._table.action_cursor_up()
 
     def action_cursor_bottom(self) -> None:
-        self.query_one("#table", DataTable).action_scroll_end()
+        self._table.action_scroll_end()
 
     async def action_refresh(self) -> None:
         await self.refresh_all()
@@ -990,20 +1233,23 @@ class TorshApp(App):
         except Exception as e:
             self.notify(f"❌ Error: {e}", severity="error")
 
-    async def action_delete(self) -> None:
+    async def _confirm_and_remove(self, *, delete_data: bool) -> None:
+        """Shared confirm-then-remove flow for both delete actions."""
         if not await self._check_connection():
             return
         torrent = self._current()
         if not torrent:
             return
+        note = "Data will also be removed" if delete_data else "Data will be kept"
+        label = "Deleted" if delete_data else "Deleted (kept data)"
 
         async def _remove() -> None:
             try:
-                await self.controller.remove([torrent.id], delete_data=True)
+                await self.controller.remove([torrent.id], delete_data=delete_data)
                 self._completed_ids.discard(torrent.id)
                 self._user_paused.discard(torrent.id)
                 self._auto_started.discard(torrent.id)
-                self.notify(f"🗑 Deleted: {torrent.name[:20]}", severity="warning")
+                self.notify(f"🗑 {label}: {torrent.name[:20]}", severity="warning")
                 await self.refresh_all()
             except Exception as e:
                 self.notify(f"❌ Error: {e}", severity="error")
@@ -1013,36 +1259,15 @@ class TorshApp(App):
                 self.run_worker(_remove())
 
         self._show_modal_with_callback(
-            ConfirmScreen(f"Delete '{torrent.name}'?\n(Data will also be removed)"),
+            ConfirmScreen(f"Delete '{torrent.name}'?\n({note})"),
             _on_dismiss,
         )
 
-    async def action_delete_keep(self) -> None:
-        if not await self._check_connection():
-            return
-        torrent = self._current()
-        if not torrent:
-            return
-
-        async def _remove() -> None:
-            try:
-                await self.controller.remove([torrent.id], delete_data=False)
-                self._completed_ids.discard(torrent.id)
-                self._user_paused.discard(torrent.id)
-                self._auto_started.discard(torrent.id)
-                self.notify(f"🗑 Deleted (kept data): {torrent.name[:20]}", severity="warning")
-                await self.refresh_all()
-            except Exception as e:
-                self.notify(f"❌ Error: {e}", severity="error")
-
-        def _on_dismiss(result: bool | None) -> None:
-            if result:
-                self.run_worker(_remove())
+    async def action_delete(self) -> None:
+        await self._confirm_and_remove(delete_data=True)
 
-        self._show_modal_with_callback(
-            ConfirmScreen(f"Delete '{torrent.name}'?\n(Data will be kept)"),
-            _on_dismiss,
-        )
+    async def action_delete_keep(self) -> None:
+        await self._confirm_and_remove(delete_data=False)
 
     async def action_move(self) -> None:
         if not await self._check_connection():
@@ -1140,6 +1365,7 @@ class TorshApp(App):
         result = await self._show_modal(FilterScreen(self.filter_text))
         if result is not None:
             self.filter_text = result
+            self._filter_text_lower = result.lower()
             self._apply_filter()
             self._render_table()
             self._persist_ui()
@@ -1176,24 +1402,17 @@ class TorshApp(App):
         self._set_refresh_interval(self.refresh_interval + 0.5)
         self.notify(f"Refresh: {self.refresh_interval:.1f}s", severity="information")
 
-    def action_sort_1(self) -> None: self._set_sort(1)
-    def action_sort_2(self) -> None: self._set_sort(2)
-    def action_sort_3(self) -> None: self._set_sort(3)
-    def action_sort_4(self) -> None: self._set_sort(4)
-    def action_sort_5(self) -> None: self._set_sort(5)
-    def action_sort_6(self) -> None: self._set_sort(6)
-    def action_sort_7(self) -> None: self._set_sort(7)
-    def action_sort_8(self) -> None: self._set_sort(8)
+    def action_sort(self, col: int) -> None:
+        self._set_sort(col)
 
     # -------------------------------------------------------------------------
     # Event Handlers
     # -------------------------------------------------------------------------
 
     def on_data_table_header_selected(self, event: DataTable.HeaderSelected) -> None:
-        if event.control.id == "table":
-            col_map = {0: 1, 1: 2, 2: 3, 3: 4, 4: 5, 5: 6, 6: 7, 7: 8}
-            if event.column_index in col_map:
-                self._set_sort(col_map[event.column_index])
+        if event.control.id == "table" and 0 <= event.column_index < 8:
+            # Column index maps straight onto the 1-based sort column.
+            self._set_sort(event.column_index + 1)
 
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         if event.control.id == "table" and event.row_key:
@@ -1218,7 +1437,7 @@ class TorshApp(App):
     def _current(self) -> TorrentView | None:
         if self.selected_id is None:
             return None
-        return next((t for t in self.torrents if t.id == self.selected_id), None)
+        return self._torrents_by_id.get(self.selected_id)
 
     def _show_modal_with_callback(self, screen: ModalScreen[T], callback: Any) -> None:
         """Show modal screen with callback on dismiss."""
@@ -1233,7 +1452,7 @@ class TorshApp(App):
                         if self._refresh_timer is None:
                             self._refresh_timer = self.set_interval(refresh_interval, self.refresh_all)
                     except Exception as timer_exc:
-                        LOG.debug(f"Failed to restart refresh timer: {timer_exc}")
+                        LOG.debug("Failed to restart refresh timer: %s", timer_exc)
                 callback(result)
             except Exception as dismiss_exc:
                 LOG.error(f"Modal dismiss callback error: {dismiss_exc}")